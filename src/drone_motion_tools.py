@@ -3,17 +3,24 @@ drone_motion_tools.py - Helper functions for the project.
 
 This module contains utility functions for the project.
 
+Global Variables:
+    final_sequence (list): List to store the final sequence of detected moves.
+    MOVE_HANDLERS (dict): Feedback function to run for each detected move type.
+
 Functions:
     sign(num): Returns the sign of a number.
     sequence_correct_led(): Blinks the correct LED to indicate a valid sequence.
-    add_all_sensor_data(sequence): Adds sensor data to a sequence dictionary.
+    add_all_sensor_data(sequence, index, acceleration, gyro): Adds sensor data to a sequence dictionary.
     add_moves_to_sequence(valid_moves): Adds valid moves to the final sequence.
     print_all_imu(): Prints accelerometer and gyro data.
 """
 
 import sys
 import time
-from init_hardware import correct_led
+from init_hardware import correct_led, sensor, read_imu
+
+# List to store the final sequence of detected moves
+final_sequence = []
 
 
 def sign(num):
@@ -24,11 +31,9 @@ def sign(num):
         num (float): The input number.
 
     Returns:
-        int: 1 if num is positive, -1 if num is negative, else 0.
+        int: -1 if num is negative, else 1 (zero counts as positive).
     """
-    if num == 0:
-        return 1
-    return num / abs(num)
+    return 1 if num >= 0 else -1
 
 
 def sequence_correct_led():
@@ -47,22 +52,25 @@ def sequence_correct_led():
     # Reset the correct LED after blinking
     correct_led.value = False
 
-def add_all_sensor_data(sequence):
+def add_all_sensor_data(sequence, index, acceleration, gyro):
     """
     Adds sensor data to a sequence dictionary.
 
     Args:
-        sequence (dict): The sequence dictionary.
+        sequence (dict): The sequence dictionary of preallocated buffers.
+        index (int): The sample slot to write to.
+        acceleration (tuple): Accelerometer (x, y, z) reading for this sample.
+        gyro (tuple): Gyro (x, y, z) reading for this sample.
 
     Modifies:
-        sequence: Updates the AX, AY, AZ, GX, GY, and GZ lists with sensor data.
+        sequence: Updates the AX, AY, AZ, GX, GY, and GZ buffers with sensor data.
     """
-    sequence["AX"].append(round(sensor.acceleration[0], 1))
-    sequence["AY"].append(round(sensor.acceleration[1], 1))
-    sequence["AZ"].append(round(sensor.acceleration[2], 1))
-    sequence["GX"].append(round(sensor.gyro[0], 1))
-    sequence["GY"].append(round(sensor.gyro[1], 1))
-    sequence["GZ"].append(round(sensor.gyro[2], 1))
+    sequence["AX"][index] = round(acceleration[0], 1)
+    sequence["AY"][index] = round(acceleration[1], 1)
+    sequence["AZ"][index] = round(acceleration[2], 1)
+    sequence["GX"][index] = round(gyro[0], 1)
+    sequence["GY"][index] = round(gyro[1], 1)
+    sequence["GZ"][index] = round(gyro[2], 1)
 
 def add_moves_to_sequence(valid_moves):
     """
@@ -75,11 +83,16 @@ def add_moves_to_sequence(valid_moves):
         final_sequence: Updates the final_sequence list with valid moves.
     """
     for move in valid_moves:
-        if move == "FLIP":
-            sequence_correct_led()
-            print(move)
-            final_sequence.append("FLIP")
-        # ... other move cases ...
+        handler = MOVE_HANDLERS.get(move)
+        if handler:
+            handler()
+        print(move)
+        final_sequence.append(move)
+
+# Feedback to run for each detected move type, moves without an entry are only recorded
+MOVE_HANDLERS = {
+    "FLIP": sequence_correct_led,
+}
 
 def print_all_imu():
     """
@@ -90,17 +103,19 @@ def print_all_imu():
     Modifies:
         None
     """
+    acceleration, gyro = read_imu(sensor)
+
     sys.stderr.write("\x1b[2J\x1b[0;0H")  # Clear the screen
     print("Acceleration (m/s^2)")
     print("------------------------\n")
-    print("X:\t%6.1f\n" % (sensor.acceleration[0]))
-    print("Y:\t%6.1f\n" % (sensor.acceleration[1]))
-    print("Z:\t%6.1f\n" % (sensor.acceleration[2]))
+    print("X:\t%6.1f\n" % (acceleration[0]))
+    print("Y:\t%6.1f\n" % (acceleration[1]))
+    print("Z:\t%6.1f\n" % (acceleration[2]))
     print()
     print("Gyro (rad/s)")
     print("------------------------\n")
-    print("X:\t%6.1f\n" % (sensor.gyro[0]))
-    print("Y:\t%6.1f\n" % (sensor.gyro[1]))
-    print("Z:\t%6.1f\n" % (sensor.gyro[2]))
+    print("X:\t%6.1f\n" % (gyro[0]))
+    print("Y:\t%6.1f\n" % (gyro[1]))
+    print("Z:\t%6.1f\n" % (gyro[2]))
 
     time.sleep(0.05)
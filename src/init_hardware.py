@@ -29,10 +29,13 @@ Hardware Configuration:
 
 Functions:
     init_hardware(): Initialize hardware components.
+    read_imu(sensor): Read the accelerometer and gyro in one I2C transaction.
 """
 
 # Import necessary libraries
+import struct
 import time
+from math import radians
 
 import board
 from digitalio import DigitalInOut, Direction, Pull
@@ -42,6 +45,10 @@ from adafruit_lsm6ds.lsm6ds33 import LSM6DS33
 # Global variable to track initialization status
 init = False
 
+# LSM6DS33 output registers are contiguous from OUTX_L_G (0x22, gyro) to OUTZ_H_XL (0x2D, accel)
+imu_register = bytes((0x22,))
+imu_buffer = bytearray(12)
+
 def init_hardware():
     """
     Initialize hardware components.
@@ -73,8 +80,8 @@ def init_hardware():
     onboard_led = DigitalInOut(board.LED)
     onboard_led.direction = Direction.OUTPUT
 
-    # Initialize I2C and LSM6DS33 sensor
-    i2c = busio.I2C(scl=board.GP1, sda=board.GP0)
+    # Initialize I2C (fast mode, 400 kHz) and LSM6DS33 sensor
+    i2c = busio.I2C(scl=board.GP1, sda=board.GP0, frequency=400000)
     sensor = LSM6DS33(i2c)
 
     # Blink LEDs to indicate initialization
@@ -85,3 +92,28 @@ def init_hardware():
         time.sleep(0.1)
 
     init = True
+
+def read_imu(sensor):
+    """
+    Read the accelerometer and gyro in one I2C transaction.
+
+    Burst reads all 12 output bytes instead of the separate register reads done by
+    sensor.acceleration and sensor.gyro, then scales them the same way the driver does.
+
+    Args:
+        sensor (LSM6DS33): The initialized IMU sensor.
+
+    Returns:
+        tuple: Acceleration (m/s^2) and gyro (rad/s) as (x, y, z) tuples.
+    """
+    with sensor.i2c_device as i2c:
+        i2c.write_then_readinto(imu_register, imu_buffer)
+    gx, gy, gz, ax, ay, az = struct.unpack_from("<hhhhhh", imu_buffer)
+
+    acceleration = (sensor._scale_xl_data(ax), sensor._scale_xl_data(ay), sensor._scale_xl_data(az))
+    gyro = (
+        radians(sensor._scale_gyro_data(gx)),
+        radians(sensor._scale_gyro_data(gy)),
+        radians(sensor._scale_gyro_data(gz)),
+    )
+    return acceleration, gyro
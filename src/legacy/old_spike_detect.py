@@ -25,6 +25,11 @@ z_offset = 10 # don't use z_offset on raw data (flip z needs to be not around 0
 def check_sequence(sequence):
     buffer = 0
 
+    # Bind the global parameters to locals once since the loops below read them on every sample
+    pos_sensitivity = sensitivity
+    neg_sensitivity = -1 * sensitivity
+    buffer_len = buffer_offset
+    z_off = z_offset
 
     # List of pairs (index, move)
     valid_moves_indexed = []
@@ -32,7 +37,9 @@ def check_sequence(sequence):
     # Check that the imu was flipped over at some
     started_up = False
 
-    for i, z in enumerate(sequence["AZ"]):
+    az = sequence["AZ"]
+    n = len(az)
+    for i, z in enumerate(az):
 
         # Update buffer
         if buffer < 0:
@@ -45,15 +52,15 @@ def check_sequence(sequence):
                 started_up = True
             elif z < 0 and started_up:
                 # To avoid noise, check that neighbouring values are also negative (for sure flipped for a period of time)
-                if (i + 1) < (len(sequence["AZ"]) - 1) and (i - 1) > 0:
+                if 0 < i < n - 1:
                     flip = True
                     # If the IMU is rotated up in the neighbouring data, ignore the data
-                    for j in range(i - 1, i + 1 + 1):
-                        if sequence["AZ"][j] > 0:
+                    for j in (i - 1, i, i + 1):
+                        if az[j] > 0:
                             flip = False
                     if flip == True:
                         valid_moves_indexed.append(("FLIP", i, 0))
-                        buffer = buffer + buffer_offset
+                        buffer = buffer + buffer_len
                         started_up = False
 
     # X: check move forward and ignore move backward
@@ -73,12 +80,12 @@ def check_sequence(sequence):
             # this is because we want to ignore more noise even if that means missing some correct signals
             # for debugging, it's easier to have a small amount of correct signals
             # than having many all the correct signals and a lot of bad signals
-            if x < (-1 * sensitivity):
+            if x < neg_sensitivity:
                 # ignore the next buffer_offset elements in list
-                buffer = buffer + buffer_offset
-            elif x > sensitivity :
+                buffer = buffer + buffer_len
+            elif x > pos_sensitivity :
                 valid_moves_indexed.append(("RIGHT", i, x))
-                buffer = buffer + buffer_offset
+                buffer = buffer + buffer_len
                 started_up = False
 
     # Y
@@ -90,12 +97,12 @@ def check_sequence(sequence):
             buffer = buffer - 1
 
         if buffer == 0:
-            if y < (-1 * sensitivity):
+            if y < neg_sensitivity:
                 # ignore the next buffer_offset elements in list
-                buffer = buffer + buffer_offset
-            elif y > sensitivity:
+                buffer = buffer + buffer_len
+            elif y > pos_sensitivity:
                 valid_moves_indexed.append(("FORWARD", i, y))
-                buffer = buffer + buffer_offset
+                buffer = buffer + buffer_len
 
     # Z
     for i, z in enumerate(sequence["AZ"]):
@@ -109,13 +116,14 @@ def check_sequence(sequence):
         # if z > 0 then SUBTRACT 9.8m/s^s
         # if z < 0 then ADD 9.8m/s^s
         if buffer == 0:
+            dz = z - z_off
             # if see a negative acceleration motion first, not +Z motion
-            if z - z_offset < (-1 * sensitivity):
+            if dz < neg_sensitivity:
                 # ignore the next buffer_offset elements in list
-                buffer = buffer + buffer_offset
-            elif z - z_offset > sensitivity:
-                valid_moves_indexed.append(("UP", i, (z - z_offset)))
-                buffer = buffer + buffer_offset
+                buffer = buffer + buffer_len
+            elif dz > pos_sensitivity:
+                valid_moves_indexed.append(("UP", i, dz))
+                buffer = buffer + buffer_len
 
     # -X
     for i, x in enumerate(sequence["AX"]):
@@ -126,12 +134,12 @@ def check_sequence(sequence):
             buffer = buffer - 1
 
         if buffer == 0:
-            if x > sensitivity:
+            if x > pos_sensitivity:
                 # ignore the next buffer_offset elements in list
-                buffer = buffer + buffer_offset
-            elif x < -1 * sensitivity :
+                buffer = buffer + buffer_len
+            elif x < neg_sensitivity :
                 valid_moves_indexed.append(("LEFT", i, -1 * x))
-                buffer = buffer + buffer_offset
+                buffer = buffer + buffer_len
 
     # -Y
     for i, y in enumerate(sequence["AY"]):
@@ -142,12 +150,12 @@ def check_sequence(sequence):
             buffer = buffer - 1
 
         if buffer == 0:
-            if y > sensitivity:
+            if y > pos_sensitivity:
                 # ignore the next buffer_offset elements in list
-                buffer = buffer + buffer_offset
-            elif y < -1 * sensitivity:
+                buffer = buffer + buffer_len
+            elif y < neg_sensitivity:
                 valid_moves_indexed.append(("BACKWARD", i, -1 * y))
-                buffer = buffer + buffer_offset
+                buffer = buffer + buffer_len
 
     # -Z
     for i, z in enumerate(sequence["AZ"]):
@@ -158,13 +166,14 @@ def check_sequence(sequence):
             buffer = buffer - 1
 
         if buffer == 0:
+            dz = z - z_off
             # if see a negative acceleration motion first, not +Z motion
-            if (z - z_offset) > (sensitivity):
+            if dz > pos_sensitivity:
                 # ignore the next buffer_offset elements in list
-                buffer = buffer + buffer_offset
-            elif (z - z_offset) < (-1 * sensitivity):
-                valid_moves_indexed.append(("DOWN", i, (z - z_offset) * -1))
-                buffer = buffer + buffer_offset
+                buffer = buffer + buffer_len
+            elif dz < neg_sensitivity:
+                valid_moves_indexed.append(("DOWN", i, dz * -1))
+                buffer = buffer + buffer_len
 
     # --------------------------------------------------------------------------------------------------------------------------------------------
     # SEQUENCE PROCESSING
@@ -7,13 +7,18 @@ handles recording, and processes sensor data to detect moves.
 Imports:
     sys: Provides functions for interacting with the console.
     time: Provides time-related functions.
+    array: Provides the typed buffers used for the sensor data sequences.
     spike_detection: Module for spike detection and move validation.
     drone_motion_tools: Module for drone motion-related functions.
     init_hardware: Module for initializing hardware components.
 
 Global Variables:
-    sequence (dict): Dictionary to store sensor data sequences.
-    final_sequence (list): List to store the final sequence of detected moves.
+    DEBUG (bool): Flag to print live IMU telemetry while recording.
+    SAMPLE_PERIOD_NS (int): Time between samples in nanoseconds.
+    SEQUENCE_LENGTH (int): Max number of samples in a recording.
+    sequence (dict): Dictionary of preallocated buffers to store sensor data sequences.
+    sample_count (int): Number of samples written to the sequence buffers.
+    final_sequence (list): List to store the final sequence of detected moves (from drone_motion_tools).
     init (bool): Flag indicating whether hardware initialization is complete.
 
 Main Loop:
@@ -21,8 +26,10 @@ Main Loop:
 
 """
 
+import sys
 import time
-from spike_detect import check_sequence
+from array import array
+from spike_detect import check_sequence, sensitivity, z_offset
 from drone_motion_tools import *
 from init_hardware import (
     init_hardware,
@@ -31,22 +38,37 @@ from init_hardware import (
     recording_led,
     correct_led,
     start_btn,
-    stop_btn
+    stop_btn,
+    read_imu
 )
 
-# Dictionary to store sensor data sequences
+# Print live IMU telemetry while recording (slows down the sample rate)
+DEBUG = False
+
+# Time between samples (10 Hz)
+SAMPLE_PERIOD_NS = 100000000
+
+# Max number of samples in a recording (10 seconds at 10 Hz)
+SEQUENCE_LENGTH = 1000
+
+# Dictionary of preallocated buffers to store sensor data sequences
 sequence = {
-    "AX": [], "AY": [], "AZ": [],
-    "GX": [], "GY": [], "GZ": [],
+    axis: array("f", [0.0] * SEQUENCE_LENGTH)
+    for axis in ("AX", "AY", "AZ", "GX", "GY", "GZ")
 }
 
-# List to store the final sequence of detected moves
-final_sequence = []
+# Number of samples written to the sequence buffers
+sample_count = 0
 
 # Flag indicating whether hardware initialization is complete
 init = False
 
+# Deadline of the current loop iteration
+next_tick = time.monotonic_ns()
+
 while True:
+    next_tick += SAMPLE_PERIOD_NS
+
     if not init:
         init_hardware()
         print("Started Program")
@@ -67,16 +89,16 @@ while True:
         ready_led.value = True
         recording_led.value = False
 
-        # Validate move
-        valid_moves = check_sequence(sequence)
+        # Validate move on the recorded part of the buffers
+        valid_moves = check_sequence({
+            axis: memoryview(values)[:sample_count]
+            for axis, values in sequence.items()
+        })
         add_moves_to_sequence(valid_moves)
 
-        # Reset the sequence for the next recording
-        sequence = {
-            "AX": [], "AY": [], "AZ": [],
-            "GX": [], "GY": [], "GZ": [],
-        }
-        final_sequence = []
+        # Reset the sequence for the next recording, reusing the same buffers and list
+        sample_count = 0
+        final_sequence.clear()
         pico_id = None
         print("\nWaiting for pico_id from client")
 
@@ -84,15 +106,27 @@ while True:
     if is_recording:
 
         # Prevent overflow (sequence terminates if trying to record for more than 10 seconds)
-        if len(sequence["AX"]) > 1000:
+        if sample_count >= SEQUENCE_LENGTH:
             print("\n\n\n\n\n\n\n\nRestarting, overflowed 10s\n\n")
-            sequence = {
-                "AX": [], "AY": [], "AZ": [],
-                "GX": [], "GY": [], "GZ": [],
-            }
-
-        add_all_sensor_data(sequence)
-
-        print((round(sensor.acceleration[0], 1), round(sensor.acceleration[1], 1), round(sensor.acceleration[2] - z_offset, 1), sensitivity, -1 * sensitivity))
-
-    time.sleep(0.1)
+            sample_count = 0
+
+        # Read the IMU once and reuse the sample for recording and telemetry
+        acceleration, gyro = read_imu(sensor)
+
+        add_all_sensor_data(sequence, sample_count, acceleration, gyro)
+        sample_count += 1
+
+        # Tuple formatted so the serial plotter can graph it against the thresholds
+        if DEBUG:
+            sys.stdout.write("(%0.1f, %0.1f, %0.1f, %d, %d)\n" % (
+                acceleration[0], acceleration[1], acceleration[2] - z_offset,
+                sensitivity, -sensitivity,
+            ))
+
+    # Sleep for what is left of the sample period so the loop body doesn't drift the sample rate
+    remaining = next_tick - time.monotonic_ns()
+    if remaining > 0:
+        time.sleep(remaining / 1e9)
+    else:
+        # Fell behind (e.g. after validating a recording), restart the schedule from now
+        next_tick = time.monotonic_ns()
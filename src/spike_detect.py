@@ -9,6 +9,9 @@ Global Variables:
     sensitivity (int): Sensitivity threshold for motion detection.
     buffer_offset (int): Offset value for buffer adjustment.
     z_offset (int): Offset value for Z-axis sensor data.
+    FLIP, RIGHT, FORWARD, UP, LEFT, BACKWARD, DOWN (int): Move type codes and move table rows.
+    MOVE_NAMES (tuple): Move name for each move type code.
+    AXIS_MOVES (tuple): Move types detected by thresholding an axis.
 
 Functions:
     apply_buffer(buffer, offset): Apply buffer adjustment to a value.
@@ -16,17 +19,37 @@ Functions:
     is_positive_motion(val, threshold): Check if a value indicates positive motion.
     is_negative_motion(val, threshold): Check if a value indicates negative motion.
     is_move_within_buffer(buffer, threshold): Check if a move is within the buffer zone.
-    get_valid_moves(sequence, sensor_values, axis_name, move_type, threshold, offset=0): Get valid moves based on sensor values.
+    get_valid_moves(hits): Get valid moves based on sensor values.
+    find_flips(az): Find the indices where the IMU was flipped over.
     check_sequence(sequence): Detect valid moves in the sensor data sequence.
-    process_valid_moves(valid_moves_indexed): Process and filter valid moves to generate the final sequence.
+    process_valid_moves(moves, strengths): Process and filter valid moves to generate the final sequence.
     find_max_moves(valid_moves_indexed): Find and filter the maximum moves within the valid moves.
 """
 
+try:
+    from ulab import numpy as np    # CircuitPython
+except ImportError:
+    import numpy as np
+
+try:
+    from numba import njit  # Host only, compiles the numeric loops
+except ImportError:
+    def njit(*args, **kwargs):
+        """Run the decorated function as plain Python when Numba is unavailable."""
+        return lambda func: func
+
 # Global parameters
 sensitivity = 4
 buffer_offset = 4
 z_offset = 10
 
+# Move types, also the row of each move type in the move tables, in tie-break order
+FLIP, RIGHT, FORWARD, UP, LEFT, BACKWARD, DOWN = range(7)
+MOVE_NAMES = ("FLIP", "RIGHT", "FORWARD", "UP", "LEFT", "BACKWARD", "DOWN")
+
+# Move types detected by thresholding an axis
+AXIS_MOVES = (RIGHT, FORWARD, UP, LEFT, BACKWARD, DOWN)
+
 # -----------------------------------------------------------------------------
 # Helper Functions
 # -----------------------------------------------------------------------------
@@ -100,35 +123,60 @@ def is_move_within_buffer(buffer, threshold):
     """
     return buffer == 0
 
-def get_valid_moves(sequence, sensor_values, axis_name, move_type, threshold, offset=0):
+def get_valid_moves(hits):
     """
     Get valid moves based on sensor values.
 
     Args:
-        sequence (dict): The sensor data sequence.
-        sensor_values (list): The sensor values for a specific axis.
-        axis_name (str): The name of the axis.
-        move_type (str): The type of move being checked.
-        threshold (float): The threshold value for valid motion.
-        offset (float, optional): Offset to apply to sensor values. Defaults to 0.
+        hits (ndarray): Boolean mask of the sensor values that are over the threshold.
+
+    Yields:
+        int: Index of each valid move.
+    """
+    # Only walk the samples that crossed the threshold
+    candidates = np.nonzero(hits)[0]
+
+    buffer_len = buffer_offset
+    next_allowed = 0
+    for i in candidates:
+        i = int(i)
+        if i < next_allowed:
+            continue
+        yield i
+        next_allowed = i + buffer_len
+
+@njit(cache=True)
+def find_flips(az):
+    """
+    Find the indices where the IMU was flipped over.
+
+    Args:
+        az (ndarray): The raw Z-axis sensor values.
 
     Returns:
-        list: List of valid moves.
+        list: Indices of the detected flips.
     """
-    valid_moves = []
-    buffer = 0
+    n = len(az)
+    flips = []
+
+    # A flip candidate is a negative sample whose neighbours are not positive,
+    # so every sample except the first and last can be a candidate
+    not_positive = az <= 0
+    candidates = np.nonzero((az[1:n - 1] < 0) & not_positive[:n - 2] & not_positive[2:])[0] + 1
 
-    for i, val in enumerate(sensor_values):
-        buffer = apply_buffer(buffer, buffer_offset)
+    # A candidate only counts if the IMU was upright at some point since the last flip
+    upright = np.nonzero(az >= 0)[0]
+    upright_count = len(upright)
+    next_upright = 0
 
-        if is_move_within_buffer(buffer, threshold):
-            if move_type == "UP" or move_type == "DOWN":
-                val = apply_offset(val, offset)
-            if is_positive_motion(val, threshold):
-                valid_moves.append((move_type, i, val))
-                buffer += buffer_offset
+    for i in candidates:
+        i = int(i)
+        if next_upright < upright_count and upright[next_upright] < i:
+            flips.append(i)
+            while next_upright < upright_count and upright[next_upright] < i:
+                next_upright += 1
 
-    return valid_moves
+    return flips
 
 # -----------------------------------------------------------------------------
 # IMU DATA PARSING -> SEQUENCE
@@ -144,69 +192,75 @@ def check_sequence(sequence):
     Returns:
         list: List of detected valid moves.
     """
-    valid_moves_indexed = []
-
-    # Check for flip motion
-    started_up = False
-    for i, z in enumerate(sequence["AZ"]):
-        buffer = apply_buffer(0, 0)  # Reset buffer for each iteration
-
-        if is_move_within_buffer(buffer, 0):
-            if z >= 0:
-                started_up = True
-            elif z < 0 and started_up:
-                if (i + 1) < (len(sequence["AZ"]) - 1) and (i - 1) > 0:
-                    flip = True
-                    for j in range(i - 1, i + 1 + 1):
-                        if sequence["AZ"][j] > 0:
-                            flip = False
-                    if flip:
-                        valid_moves_indexed.append(("FLIP", i, 0))
-                        buffer = buffer + buffer_offset
-                        started_up = False
-
-    valid_moves_indexed.extend(get_valid_moves(sequence, sequence["AX"], "AX", "RIGHT", sensitivity))
-    valid_moves_indexed.extend(get_valid_moves(sequence, sequence["AY"], "AY", "FORWARD", sensitivity))
-    valid_moves_indexed.extend(get_valid_moves(sequence, sequence["AZ"], "AZ", "UP", sensitivity, z_offset))
-    valid_moves_indexed.extend(get_valid_moves(sequence, sequence["AX"], "AX", "LEFT", sensitivity))
-    valid_moves_indexed.extend(get_valid_moves(sequence, sequence["AY"], "AY", "BACKWARD", sensitivity))
-    valid_moves_indexed.extend(get_valid_moves(sequence, sequence["AZ"], "AZ", "DOWN", sensitivity, z_offset))
-
-    return process_valid_moves(valid_moves_indexed)
+    # Convert each axis to an array once and reuse it for both directions
+    ax = np.array(sequence["AX"])
+    ay = np.array(sequence["AY"])
+    az = np.array(sequence["AZ"])
+    az_off = apply_offset(az, z_offset)
+    n = len(az)
+
+    # Skip the scans for recordings without any spike (a flip always needs a negative Z sample)
+    if n == 0 or (
+        np.max(abs(ax)) <= sensitivity
+        and np.max(abs(ay)) <= sensitivity
+        and np.max(abs(az_off)) <= sensitivity
+        and np.min(az) >= 0
+    ):
+        return []
+
+    # Stack the signed axes so a single comparison finds the spikes in every direction
+    # Each row is the move strength for one move type, flips have no strength
+    strengths = np.concatenate((np.zeros(n), ax, ay, az_off, -ax, -ay, -az_off)).reshape((len(MOVE_NAMES), n))
+    hits = strengths > sensitivity
+
+    # Packed table of detected moves, one row per move type and one column per sample
+    moves = np.zeros((len(MOVE_NAMES), n), dtype=np.uint8)
+    for i in find_flips(az):
+        moves[FLIP, i] = 1
+    for move_type in AXIS_MOVES:
+        for i in get_valid_moves(hits[move_type]):
+            moves[move_type, i] = 1
+
+    return process_valid_moves(moves, strengths)
 
 # -----------------------------------------------------------------------------
 # SEQUENCE PROCESSING
 # -----------------------------------------------------------------------------
 
-def process_valid_moves(valid_moves_indexed):
+def process_valid_moves(moves, strengths):
     """
     Process and filter valid moves to generate the final sequence of detected moves.
 
     Args:
-        valid_moves_indexed (list): List of indexed valid moves.
+        moves (ndarray): Table of detected moves, one row per move type and one column per sample.
+        strengths (ndarray): Move strength for each move type and sample.
 
     Returns:
         list: Final sequence of detected moves.
     """
     sorted_moves = []
     tolerance = 4
-
-    valid_moves_indexed.sort(key=lambda x: x[1])
-
-    flip_occurrence_indices = [pair[1] for pair in valid_moves_indexed if pair[0] == "FLIP"]
-
-    moves_to_remove = []
-    for index in flip_occurrence_indices:
-        for move_index, pair in enumerate(valid_moves_indexed):
-            if abs(pair[1] - index) < tolerance and pair[0] != "FLIP":
-                moves_to_remove.append(move_index)
-    moves_to_remove.sort(reverse=True)
-    for index in moves_to_remove:
-        del valid_moves_indexed[index]
+    n = moves.shape[1]
+
+    # Mark the samples within tolerance of a flip, flip takes precedence over all moves there
+    flips = moves[FLIP]
+    near_flip = np.zeros(n, dtype=np.uint8)
+    for shift in range(min(tolerance, n)):
+        near_flip[shift:] = near_flip[shift:] + flips[:n - shift]
+        near_flip[:n - shift] = near_flip[:n - shift] + flips[shift:]
+    not_near_flip = near_flip == 0
+    for move_type in AXIS_MOVES:
+        moves[move_type] = moves[move_type] * not_near_flip
+
+    # Reading the table column by column lists the moves sorted by time, ties in move type order
+    valid_moves_indexed = []
+    for position in np.nonzero(moves.transpose().flatten())[0]:
+        i, move_type = divmod(int(position), len(MOVE_NAMES))
+        valid_moves_indexed.append((move_type, i, float(strengths[move_type, i])))
 
     sorted_moves = find_local_max_moves(valid_moves_indexed)
 
-    final_moves = [move[0] for move in sorted_moves]
+    final_moves = [MOVE_NAMES[move[0]] for move in sorted_moves]
 
     return final_moves
 
@@ -228,8 +282,6 @@ def find_local_max_moves(valid_moves_indexed):
         current_max_val = valid_moves_indexed[0][2]
 
         for i in range(len(valid_moves_indexed)):
-            buffer = apply_buffer(0, 0)  # Reset buffer for each iteration
-
             if valid_moves_indexed[i][1] > starting_range_index + 3:
                 sorted_moves.append(valid_moves_indexed[current_max_index])
                 starting_range_index = valid_moves_indexed[i][1]
@@ -237,4 +289,11 @@ def find_local_max_moves(valid_moves_indexed):
                 current_max_index = i
             else:
                 if valid_moves_indexed[i][2] > current_max_val:
-                    current
+                    current_max_val = valid_moves_indexed[i][2]
+                    current_max_index = i
+
+        sorted_moves.append(valid_moves_indexed[current_max_index])
+    elif len(valid_moves_indexed) == 1:
+        sorted_moves.append(valid_moves_indexed[0])
+
+    return sorted_moves